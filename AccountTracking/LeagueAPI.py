@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# api key is read from the environment so it never ends up in the source
+API_KEY = os.environ.get("RIOT_API_KEY", "")
+REGION = "americas"
+
+# Retry rate limited (429) and server error responses with exponential backoff,
+# waiting as long as riot's Retry-After header asks. Once retries run out the last
+# response is returned so the caller can report the error.
+RETRIES = Retry(total=5, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods={"GET"}, respect_retry_after_header=True, raise_on_status=False)
+
+# Shared session so every lookup reuses one pooled connection to the riot api
+# api key is sent as a header instead of being templated into every url
+SESSION = requests.Session()
+SESSION.headers.update({"X-Riot-Token": API_KEY})
+SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=RETRIES))
+
+# Number of lookups in flight at once, the rate limiters below decide how fast they go
+MAX_WORKERS = 10
+
+
+# Allows at most `limit` requests in any `period` seconds, shared by all threads
+class RateLimiter:
+
+    def __init__(self, limit, period):
+        self.limit = limit
+        self.period = period
+        self.sent = deque()
+        self.lock = threading.Lock()
+
+    # block until another request fits in the window, then record it
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            while self.sent and now - self.sent[0] >= self.period:
+                self.sent.popleft()
+
+            if len(self.sent) >= self.limit:
+                time.sleep(self.period - (now - self.sent[0]))
+                self.sent.popleft()
+
+            self.sent.append(time.monotonic())
+
+
+# Riot development key limits: 20 requests per 1 second and 100 requests per 2 minutes
+RATE_LIMITS = [RateLimiter(20, 1), RateLimiter(100, 120)]
+
+
+# GET a riot api url, staying under the rate limits (retries are handled by the session)
+def request_riot_api(url):
+    for limiter in RATE_LIMITS:
+        limiter.wait()
+
+    return SESSION.get(url, timeout=5)
+
+
+# Riot ID -> puuid results are appended here as they arrive and reused across runs until they expire
+# (puuid -> ign is never cached, that lookup is how name changes are noticed)
+PUUID_CACHE_FILE = 'puuid_cache.jsonl'
+PUUID_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days
+
+
+def load_puuid_cache():
+    cache = {}
+    if not os.path.exists(PUUID_CACHE_FILE):
+        return cache
+
+    with open(PUUID_CACHE_FILE, 'r') as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # partial last line from an interrupted run
+                continue
+
+            # later lines are newer lookups of the same name
+            cache[record['name']] = record
+
+    return cache
+
+
+# an interrupted run can leave a partial last line without a trailing newline
+def cache_ends_mid_line():
+    if not os.path.exists(PUUID_CACHE_FILE) or os.path.getsize(PUUID_CACHE_FILE) == 0:
+        return False
+
+    with open(PUUID_CACHE_FILE, 'rb') as file:
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) != b'\n'
+
+
+# write one lookup to the cache file straight away so an interrupted run keeps its progress
+def save_puuid(summoner_name, puuid):
+    global puuid_cache_mid_line
+    record = {'name': summoner_name, 'puuid': puuid, 'ts': time.time()}
+    line = json.dumps(record) + '\n'
+
+    with puuid_cache_lock:
+        # start on a fresh line so the record isn't glued onto a partial one
+        if puuid_cache_mid_line:
+            line = '\n' + line
+            puuid_cache_mid_line = False
+
+        puuid_cache[summoner_name] = record
+        with open(PUUID_CACHE_FILE, 'a') as file:
+            file.write(line)
+
+
+# Dictionary of summoner name -> {'name': ..., 'puuid': ..., 'ts': time it was looked up}
+puuid_cache = load_puuid_cache()
+puuid_cache_mid_line = cache_ends_mid_line()
+puuid_cache_lock = threading.Lock()
+
+
+# Base URL to get summoner information by ign, built once (gamename/tagline are appended per call)
+SUMMONER_URL = f'https://{REGION}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/'
+
+# Base URL to get summoner ign by puuid (puuid is appended per call)
+SUMMONER_URL2 = f'https://{REGION}.api.riotgames.com/riot/account/v1/accounts/by-puuid/'
+
+
+# get puuid using the summoner ign
+def get_summoner_puuid(summoner_name):
+
+    #     RoseThorn#Rose
+
+    # reuse a recent lookup instead of asking riot again
+    cached = puuid_cache.get(summoner_name)
+    if cached and cached['ts'] > time.time() - PUUID_CACHE_TTL:
+        return cached['puuid']
+
+    # split summoner name into gamename and tagline (only on the first '#')
+    gameName, tagLine = summoner_name.split('#', 1)
+
+    # build URL, escaping spaces, '/', '?' and non-ascii names like Jænsen
+    url = SUMMONER_URL + quote(gameName, safe='') + '/' + quote(tagLine, safe='')
+
+    # request from riot api
+    response = request_riot_api(url)
+
+    # valid summoner ign found
+    if response.status_code == 200:
+        puuid = response.json().get('puuid')
+        save_puuid(summoner_name, puuid)
+        return puuid
+
+    else:
+        print(f"Error {response.status_code}: Unable to retrieve data for {summoner_name}")
+        return None
+
+
+# get summoner ign using the puuid
+def get_summoner_ign(puuid):
+    gameName = ""
+    tagLine = ""
+
+    # build URL
+    url = SUMMONER_URL2 + puuid
+
+    # request from riot api
+    response = request_riot_api(url)
+
+    # valid summoner ign found
+    if response.status_code == 200:
+        gameName = response.json().get('gameName')
+        tagLine = response.json().get('tagLine')
+        ign = gameName + "#"+ tagLine
+        return ign
+
+
+    else:
+        print(f"Error {response.status_code}: Unable to retrieve data for {puuid}")
+        return None
+
+
+# run lookup on every key concurrently, keeping only the keys that resolved (in input order)
+def lookup_all(lookup, keys):
+    keys = list(keys)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = list(executor.map(lookup, keys))
+
+    return {key: result for key, result in zip(keys, results) if result}
@@ -1,11 +1,11 @@
-import requests
-import time
 import pandas as pd
 import json
+import sys
 
+from LeagueAPI import SESSION, get_summoner_puuid, get_summoner_ign, lookup_all
 
-API_KEY = ""
-REGION = "americas"
+# pass --verbose to print every result once it has been saved
+verbose = '--verbose' in sys.argv
 
 # My puuid, gamename, tagline
 myPuuid =  "RGjbd24ZaxizENVpxVM3Uran5JULKnNWrfvjQVDuz92tEbpItaslEu_ualtlTq4yI6hhSSjKhp2pqg",
@@ -28,7 +28,7 @@ names_100 = ["100 Sniper#NA1",
              "Yves#100",
              "Happy Game#NA2",
              "ae3aaq34e5yh#NA1",
-             "Tomo#0999" #tomo
+             "Tomo#0999", #tomo
              "idontcare#NA3",
              "White#EX1"
 ]
@@ -110,95 +110,32 @@ names_TL = ["TL HONDA IMPACT#XDDD",
              
 ]
 
-# URL template to get summoner information by ign
-SUMMONER_URL = f'https://{REGION}.api.riotgames.com/riot/account/v1/accounts/by-riot-id/{{}}/{{}}?api_key={API_KEY}'
+# Team rosters, flattened once into a single tuple of names to look up
+teams = {
+    "100": names_100,
+    "C9": names_C9,
+    "FLY": names_FLY,
+    "DIG": names_DIG,
+    "IMT": names_IMT,
+    "NRG": names_NRG,
+    "SR": names_SR,
+    "TL": names_TL
+}
 
+all_names = tuple(name for names in teams.values() for name in names)
 
-# get puuid using the summoner ign
-def get_summoner_puuid(summoner_name):
-
-    #     RoseThorn#Rose
-
-    # split summoner name into gamename and tagline
-    gameName = summoner_name.split('#')[0]
-    tagLine = summoner_name.split('#')[1]
-
-    # format URL 
-    url = SUMMONER_URL.format(gameName, tagLine)
-    
-    # request from riot api
-    response = requests.get(url)
-
-    # valid summoner ign found
-    if response.status_code == 200:
-        return response.json().get('puuid')
-
-    else:
-        print(f"Error {response.status_code}: Unable to retrieve data for {summoner_name}")
-        return None
-    
-
-# Dictionary to store summoner IDs and names
-summoner_data = {}
-
-# Loop through each summoner name and retrieve their ID
-for name in names_100:
-    summoner_id = get_summoner_puuid(name)
-    if summoner_id:
-        summoner_data[name] = summoner_id
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-
-# Loop through each summoner name and retrieve their ID
-for name in names_C9:
-    summoner_id = get_summoner_puuid(name)
-    if summoner_id:
-        summoner_data[name] = summoner_id
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-
-for name in names_FLY:
-    summoner_id = get_summoner_puuid(name)
-    if summoner_id:
-        summoner_data[name] = summoner_id
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-
-for name in names_DIG:
-    summoner_id = get_summoner_puuid(name)
-    if summoner_id:
-        summoner_data[name] = summoner_id
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-for name in names_IMT:
-    summoner_id = get_summoner_puuid(name)
-    if summoner_id:
-        summoner_data[name] = summoner_id
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-
-for name in names_NRG:
-    summoner_id = get_summoner_puuid(name)
-    if summoner_id:
-        summoner_data[name] = summoner_id
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-
-for name in names_SR:
-    summoner_id = get_summoner_puuid(name)
-    if summoner_id:
-        summoner_data[name] = summoner_id
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-
-for name in names_TL:
-    summoner_id = get_summoner_puuid(name)
-    if summoner_id:
-        summoner_data[name] = summoner_id
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-
-# Print the results
-for name, summoner_id in summoner_data.items():
-    print(f"Summoner Name: {name}, Summoner ID: {summoner_id}")
-
+# Dictionary to store summoner IDs and names, every team's names looked up concurrently in one pass
+summoner_data = lookup_all(get_summoner_puuid, all_names)
 
 # Optionally, save the data to a file for future reference
 with open('data_lcs.json', 'w') as f:
     json.dump(summoner_data, f, indent=4)
 
+# Print the results
+if verbose:
+    for name, summoner_id in summoner_data.items():
+        print(f"Summoner Name: {name}, Summoner ID: {summoner_id}")
+
 
 
 
@@ -207,53 +144,19 @@ summoner_puuids = ["RGjbd24ZaxizENVpxVM3Uran5JULKnNWrfvjQVDuz92tEbpItaslEu_ualtl
                     # Add more names as needed
                     ]
 
-SUMMONER_URL2 = f'https://{REGION}.api.riotgames.com/riot/account/v1/accounts/by-puuid/{{}}?api_key={API_KEY}'
-
-def get_summoner_ign(puuid):
-    gameName = ""
-    tagLine = ""
-
-    # format URL 
-    url = SUMMONER_URL2.format(puuid)
+# Dictionary to store summoner IDs and names, looked up concurrently
+# always ask riot, its answer is the current canonical name even for puuids resolved above
+summoner_data2 = lookup_all(get_summoner_ign, summoner_puuids)
 
-    # request from riot api
-    response = requests.get(url)
-
-    # valid summoner ign found
-    if response.status_code == 200:
-        gameName = response.json().get('gameName')
-        tagLine = response.json().get('tagLine')
-        ign = gameName + "#"+ tagLine
-        return ign
-
-
-    else:
-        print(f"Error {response.status_code}: Unable to retrieve data for {puuid}")
-        return None
-
-# Dictionary to store summoner IDs and names
-summoner_data2 = {}   
-
-
-# Loop through each summoner name and retrieve their ID
-for puuid in summoner_puuids:
-    ign = get_summoner_ign(puuid)
-    if ign:
-        summoner_data2[puuid] = ign
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
+with open('summoner_data2.json', 'w') as f:
+    json.dump(summoner_data2, f, indent=4)
 
 # Print the results
-for summoner_id, name in summoner_data2.items():
-    print(f"Summoner Name: {name}, Summoner ID: {summoner_id}")
+if verbose:
+    for summoner_id, name in summoner_data2.items():
+        print(f"Summoner Name: {name}, Summoner ID: {summoner_id}")
 
-
-myURL = "https://americas.api.riotgames.com/riot/account/v1/accounts/by-puuid/RGjbd24ZaxizENVpxVM3Uran5JULKnNWrfvjQVDuz92tEbpItaslEu_ualtlTq4yI6hhSSjKhp2pqg?api_key=RGAPI-5cc10fc2-1d6b-4979-9538-6ff66ae4026a"
-
-
-
-
-with open('summoner_data2.json', 'w') as f:
-    json.dump(summoner_data2, f, indent=4)
+SESSION.close()
 
 
 
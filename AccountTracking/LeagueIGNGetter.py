@@ -1,12 +1,13 @@
-import requests
-import time
 import pandas as pd
 import json
+import sys
 
-# added comment
+from LeagueAPI import SESSION, get_summoner_ign, lookup_all
+
+# pass --verbose to print every result once it has been saved
+verbose = '--verbose' in sys.argv
 
-API_KEY = ""
-REGION = "americas"
+# added comment
 
 # My puuid, gamename, tagline
 myPuuid =  "RGjbd24ZaxizENVpxVM3Uran5JULKnNWrfvjQVDuz92tEbpItaslEu_ualtlTq4yI6hhSSjKhp2pqg",
@@ -21,78 +22,44 @@ summoner_names = [
     # Add more names as needed
 ]
 
-# Dictionary to store summoner IDs and names
-summoner_data2 = {}   
-
 summoner_puuids = ["RGjbd24ZaxizENVpxVM3Uran5JULKnNWrfvjQVDuz92tEbpItaslEu_ualtlTq4yI6hhSSjKhp2pqg",
                     "H0vgUX-f5tet5-Q3tL_LrJ7X7eQiZFiwTngYtBu80XYl38MmNwTWIV5X7DltO6X_qYR7B_YHucGYGQ"
                     # Add more names as needed
                     ]
 
-SUMMONER_URL2 = f'https://{REGION}.api.riotgames.com/riot/account/v1/accounts/by-puuid/{{}}?api_key={API_KEY}'
-
-def get_summoner_ign(puuid):
-    gameName = ""
-    tagLine = ""
-
-    # format URL 
-    url = SUMMONER_URL2.format(puuid)
-
-    # request from riot api
-    response = requests.get(url)
-
-    # valid summoner ign found
-    if response.status_code == 200:
-        gameName = response.json().get('gameName')
-        tagLine = response.json().get('tagLine')
-        ign = gameName + "#"+ tagLine
-        return ign
-
-
-    else:
-        print(f"Error {response.status_code}: Unable to retrieve data for {puuid}")
-        return None
-
 
 
 
 
-
-myURL = "https://americas.api.riotgames.com/riot/account/v1/accounts/by-puuid/RGjbd24ZaxizENVpxVM3Uran5JULKnNWrfvjQVDuz92tEbpItaslEu_ualtlTq4yI6hhSSjKhp2pqg?api_key=RGAPI-5cc10fc2-1d6b-4979-9538-6ff66ae4026a"
-
-
-
-
-# Function to recursively get all values from a JSON object
+# Function to get all values from a JSON object, walking it with a stack instead of recursion
 def get_all_values(obj):
-    if isinstance(obj, dict):
-        for value in obj.values():
-            yield from get_all_values(value)
-    elif isinstance(obj, list):
-        for item in obj:
-            yield from get_all_values(item)
-    else:
-        yield obj
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        # children are pushed reversed so values come out in file order
+        if isinstance(obj, dict):
+            stack.extend(reversed(list(obj.values())))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+        else:
+            yield obj
 
 # Read the JSON file
 with open('data_lcs.json', 'r') as file:
     data = json.load(file)
 
-# Get all values
-all_values = list(get_all_values(data))
+# Get all values, dropping repeats so each puuid is only looked up once
+all_values = list(dict.fromkeys(get_all_values(data)))
 
-# Print all values
-for value in all_values:
-    ign = get_summoner_ign(value)
-    if ign:
-        summoner_data2[value] = ign
-    time.sleep(1.2)  # Rate limiting: 50 requests per 1 second
-
-# Print the results
-for summoner_id, name in summoner_data2.items():
-    print(f"Summoner Name: {name}, Summoner ID: {summoner_id}")
+# Dictionary to store summoner IDs and names, every puuid is looked up concurrently
+summoner_data2 = lookup_all(get_summoner_ign, all_values)
 
+with open('data_lcs2.json', 'w') as f:
+    json.dump(summoner_data2, f, indent=4)
 
+# Print the results
+if verbose:
+    for summoner_id, name in summoner_data2.items():
+        print(f"Summoner Name: {name}, Summoner ID: {summoner_id}")
 
-with open('data_lcs2.json', 'w') as f:
-    json.dump(summoner_data2, f, indent=4)
\ No newline at end of file
+SESSION.close()
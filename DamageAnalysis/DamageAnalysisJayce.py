@@ -25,6 +25,9 @@ abilities13 = {
 #R1 is cannon -> hammer enhanced auto
 #R2 20% armor/mr reduction
 
+# abilities that count as basic attacks (muramana on-hit instead of ability bonus)
+basic_attacks = frozenset(['A', 'W1A'])
+
 # Jayce mana lv 13 - 18
 mana = [867.75, 919.05, 971.93, 1026.38, 1082.4, 1140]
 
@@ -41,30 +44,56 @@ item_sets_13 = {
 
 
 
+# fraction of physical/magic damage that gets through the target's resistances
+def damage_multipliers(items, armor, mr):
+
+    # Calculate effective resistance considering penetration
+    # flat armor reduction -> % armor reduction -> % armor pen -> flat armor pen
+    # armor/mr reduction alrdy occured in R2 calculation (only reduction calculation needed)
+    effective_armor = armor * (1 - items['percent_armor_pen']) - items['flat_armor_pen']
+
+    # not considering magic pen (Jayce gets 0)
+    # effective_mr = mr * (1 - items['percent_mr_pen']) - items['flat_mr_pen']
+
+    return 100 / (100 + effective_armor), 100 / (100 + mr)
+
+
+# armor and mr can be numpy arrays to evaluate a whole sweep in one call
 def calculate_damage(ability_list, items, health, armor, mr):
     
     total_damage = 0
     
-    dmg_count = 0
+    # muramana/eclipse bonuses don't depend on the ability, compute them once per combo
+    total_mana = mana[0] + muramana_mana
+    muramana_onhit_damage = .015 * total_mana
+    muramana_ability_damage = .027 * total_mana + (items['ad'] * .06)
+    eclipse_damage = .06 * health
     
-    for ability in ability_list:
+    # resistances only change on R2, so the multipliers are only recomputed there
+    physical_multiplier, magic_multiplier = damage_multipliers(items, armor, mr)
+    
+    for dmg_count, ability in enumerate(ability_list, 1):
         
         specific = abilities13[ability]
         
-        dmg_count = dmg_count + 1
+        # reset so a branch never reuses the previous ability's damage
+        ad_damage = 0
+        ap_damage = 0
         
         # armor/mr reduction from cannon auto
-        if (specific == 'R2'):
-            armor *= .8
-            mr *= .8
+        if (ability == 'R2'):
+            # not in place, armor/mr may be the caller's arrays
+            armor = armor * .8
+            mr = mr * .8
+            physical_multiplier, magic_multiplier = damage_multipliers(items, armor, mr)
             
         # max health damage from hammer E
-        elif (specific == 'E2'):
+        elif (ability == 'E2'):
             ap_damage = .08 * health + items['ad'] * specific['ad_ratio']
             
         # muramana bonus onhit
-        elif ((specific == 'W1A') or (specific == 'A')):
-            ad_damage = .015 * (mana[0] + muramana_mana) + specific['physical_damage'] + (items['ad'] * specific['ad_ratio'])
+        elif (ability in basic_attacks):
+            ad_damage = muramana_onhit_damage + specific['physical_damage'] + (items['ad'] * specific['ad_ratio'])
             
         else:
             ad_damage = specific['physical_damage'] + (items['ad'] * specific['ad_ratio'])
@@ -73,25 +102,20 @@ def calculate_damage(ability_list, items, health, armor, mr):
             
             
             # manamune bonus ability dmg
-            ad_damage += .027 * (mana[0] + muramana_mana) + (items['ad'] * .06)
+            ad_damage += muramana_ability_damage
             
         # eclipse proc (assumed melee) 
         if (dmg_count == 2):
-            ad_damage += .06 * health
+            ad_damage += eclipse_damage
             
-    
-    # Calculate effective resistance considering penetration
-    # flat armor reduction -> % armor reduction -> % armor pen -> flat armor pen
-    # armor/mr reduction alrdy occured in R2 calculation (only reduction calculation needed)
-    
-        effective_armor = armor * (1 - items['percent_armor_pen']) - items['flat_armor_pen']
-        physical_damage_taken = ad_damage * 100 / (100 + effective_armor)
-    
-    # not considering magic pen (Jayce gets 0)
-        # effective_mr = mr * (1 - items['percent_mr_pen']) - items['flat_mr_pen']
-        magic_damage_taken = ap_damage * 100 / (100 + mr)
-        
-        total_damage = total_damage + physical_damage_taken + magic_damage_taken
+        # skip the mitigation math for a damage type the ability doesn't deal
+        if ad_damage > 0:
+            physical_damage_taken = ad_damage * physical_multiplier
+            total_damage = total_damage + physical_damage_taken
+
+        if ap_damage > 0:
+            magic_damage_taken = ap_damage * magic_multiplier
+            total_damage = total_damage + magic_damage_taken
         
     
     
@@ -150,12 +174,12 @@ plt.show()
 '''
 
 # Calculate damage for each item set across armor values
-damage_item_set_1 = [calculate_damage(example_abilities_1, item_sets_13['Item Set 1'], health, armor, mr) for armor in armor_range]
-damage_item_set_2 = [calculate_damage(example_abilities_1_1, item_sets_13['Item Set 2'], health, armor, mr) for armor in armor_range]
+damage_item_set_1 = calculate_damage(example_abilities_1, item_sets_13['Item Set 1'], health, armor_range, mr)
+damage_item_set_2 = calculate_damage(example_abilities_1_1, item_sets_13['Item Set 2'], health, armor_range, mr)
 
 
 # Calculate damage differential
-damage_differential = np.array(damage_item_set_1) - np.array(damage_item_set_2)
+damage_differential = damage_item_set_1 - damage_item_set_2
 
 # Plot the results
 plt.figure(figsize=(10, 6))
@@ -168,12 +192,12 @@ plt.grid(True)
 plt.show()
 
 # Calculate damage for each item set across armor values
-damage_item_set_3 = [calculate_damage(example_abilities_2, item_sets_13['Item Set 1'], health, armor, mr) for armor in armor_range]
-damage_item_set_4 = [calculate_damage(example_abilities_2, item_sets_13['Item Set 2'], health, armor, mr) for armor in armor_range]
+damage_item_set_3 = calculate_damage(example_abilities_2, item_sets_13['Item Set 1'], health, armor_range, mr)
+damage_item_set_4 = calculate_damage(example_abilities_2, item_sets_13['Item Set 2'], health, armor_range, mr)
 
 
 # Calculate damage differential
-damage_differential2 = np.array(damage_item_set_3) - np.array(damage_item_set_4)
+damage_differential2 = damage_item_set_3 - damage_item_set_4
 
 # Plot the results
 plt.figure(figsize=(10, 6))
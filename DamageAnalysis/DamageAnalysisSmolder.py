@@ -43,14 +43,12 @@ combo5 = ['W', 'A', 'Q']
 combo6 = ['E']
 class Smolder:
 
-    def __init__(self):
-        self.level = 13
-        self.ad = attackDamage[5]
-        self.mana = mana[0]
-        self.items = []
+    __slots__ = ('level', 'ad', 'mana', 'items')
 
-
-    def __init__(self, level, items):
+    # stats are looked up from the level tables above (defaults to lv 13, no items)
+    def __init__(self, level=13, items=None):
+        if items is None:
+            items = []
         self.level = level
         self.ad = attackDamage[level - 8]
         self.mana = mana[self.level - 13] if level >= 13 else 0 